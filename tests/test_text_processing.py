@@ -47,6 +47,25 @@ class TestCoreTextProcessing(unittest.TestCase):
         result = counter.process(text)
         self.assertEqual(result, {"apple": 3, "banana": 2, "orange": 1})
 
+    def test_cache_decorator(self):
+        from text_processing import CacheDecorator
+
+        calls = []
+
+        class RecordingProcessor:
+            def process(self, text):
+                calls.append(text)
+                return text.upper()
+
+        cached = CacheDecorator(RecordingProcessor())
+        self.assertEqual(cached.process("hello"), "HELLO")
+        self.assertEqual(cached.process("hello"), "HELLO")
+        self.assertEqual(calls, ["hello"])  # 第二次调用命中缓存
+
+        cached.clear_cache()
+        cached.process("hello")
+        self.assertEqual(calls, ["hello", "hello"])
+
     def test_keyword_extractor(self):
         extractor = KeywordExtractor(top_k=2)
         text = "python is great and python is powerful"
@@ -62,31 +81,33 @@ class TestCoreTextProcessing(unittest.TestCase):
 class TestFileProcessing(unittest.TestCase):
     """测试文件处理功能"""
 
-    def setUp(self):
-        # 创建临时目录
-        self.temp_dir = tempfile.TemporaryDirectory()
+    @classmethod
+    def setUpClass(cls):
+        # 整个测试类共享一个临时目录，夹具文件只写入一次
+        cls.temp_dir = tempfile.TemporaryDirectory()
 
         # 创建文本文件
-        self.text_file = os.path.join(self.temp_dir.name, "test.txt")
-        with open(self.text_file, "w", encoding="utf-8") as f:
+        cls.text_file = os.path.join(cls.temp_dir.name, "test.txt")
+        with open(cls.text_file, "w", encoding="utf-8") as f:
             f.write("Line 1\nLine 2\nLine 3")
 
         # 创建没有扩展名的文本文件
-        self.no_ext_file = os.path.join(self.temp_dir.name, "no_extension")
-        with open(self.no_ext_file, "w", encoding="utf-8") as f:
+        cls.no_ext_file = os.path.join(cls.temp_dir.name, "no_extension")
+        with open(cls.no_ext_file, "w", encoding="utf-8") as f:
             f.write("No extension file content")
 
         # 创建CSV文件
-        self.csv_file = os.path.join(self.temp_dir.name, "test.csv")
-        with open(self.csv_file, "w", encoding="utf-8", newline='') as f:
+        cls.csv_file = os.path.join(cls.temp_dir.name, "test.csv")
+        with open(cls.csv_file, "w", encoding="utf-8", newline='') as f:
             writer = csv.writer(f)
             writer.writerow(["Name", "Age", "City"])
             writer.writerow(["Alice", "30", "New York"])
             writer.writerow(["Bob", "25", "London"])
             writer.writerow(["Charlie", "35", "Paris"])
 
-    def tearDown(self):
-        self.temp_dir.cleanup()
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
 
     def test_text_file_reader(self):
         reader = TextFileReader()
@@ -203,6 +224,30 @@ class TestMatrixProcessing(unittest.TestCase):
             [3, 6, 9]
         ])
 
+    def test_matrix_aggregator(self):
+        from text_processing import MatrixAggregator
+
+        # 整体聚合
+        self.assertEqual(MatrixAggregator(operation="sum").process(self.matrix), 45)
+
+        # 按行/按列聚合
+        self.assertEqual(MatrixAggregator(operation="sum", axis="row").process(self.matrix), [6, 15, 24])
+        self.assertEqual(MatrixAggregator(operation="max", axis="column").process(self.matrix), [7, 8, 9])
+        self.assertEqual(MatrixAggregator(operation="mean", axis="row").process(self.matrix), [2, 5, 8])
+
+    def test_matrix_batch_processor(self):
+        from text_processing import MatrixBatchProcessor, MatrixRowProcessor, MatrixTransposeProcessor
+
+        batch = MatrixBatchProcessor([
+            MatrixRowProcessor(operation="delete", index=0),
+            MatrixTransposeProcessor()
+        ])
+        self.assertEqual(batch.process(self.matrix), [[4, 7], [5, 8], [6, 9]])
+
+        # 链式追加
+        batch.add(MatrixRowProcessor(operation="get", index=0))
+        self.assertEqual(batch.process(self.matrix), [4, 7])
+
     def test_matrix_converter(self):
         converter = MatrixConverter(output_format="text", row_separator="|", col_separator=",")
         result = converter.process(self.matrix)
@@ -216,22 +261,19 @@ class TestMatrixProcessing(unittest.TestCase):
 class TestAPI(unittest.TestCase):
     """测试API接口"""
 
-    def __init__(self, methodName: str = "runTest"):
-        super().__init__(methodName)
-        self.no_ext_file = None
-
-    def setUp(self):
-        # 创建临时目录
-        self.temp_dir = tempfile.TemporaryDirectory()
+    @classmethod
+    def setUpClass(cls):
+        # 整个测试类共享一个临时目录，夹具文件只写入一次
+        cls.temp_dir = tempfile.TemporaryDirectory()
 
         # 创建文本文件
-        self.text_file = os.path.join(self.temp_dir.name, "api_test.txt")
-        with open(self.text_file, "w", encoding="utf-8") as f:
+        cls.text_file = os.path.join(cls.temp_dir.name, "api_test.txt")
+        with open(cls.text_file, "w", encoding="utf-8") as f:
             f.write("Hello, world! This is an API test.")
 
         # 创建CSV文件
-        self.csv_file = os.path.join(self.temp_dir.name, "api_test.csv")
-        with open(self.csv_file, "w", encoding="utf-8", newline='') as f:
+        cls.csv_file = os.path.join(cls.temp_dir.name, "api_test.csv")
+        with open(cls.csv_file, "w", encoding="utf-8", newline='') as f:
             writer = csv.writer(f)
             writer.writerow(["ID", "Value"])
             writer.writerow(["A1", "100"])
@@ -239,12 +281,13 @@ class TestAPI(unittest.TestCase):
             writer.writerow(["C3", "300"])
 
         # 添加没有扩展名的文件
-        self.no_ext_file = os.path.join(self.temp_dir.name, "no_extension")
-        with open(self.no_ext_file, "w", encoding="utf-8") as f:
+        cls.no_ext_file = os.path.join(cls.temp_dir.name, "no_extension")
+        with open(cls.no_ext_file, "w", encoding="utf-8") as f:
             f.write("No extension API test content")
 
-    def tearDown(self):
-        self.temp_dir.cleanup()
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
 
     def test_text_processing_pipeline(self):
         # 文本处理管道：清洗 -> 分词 -> 关键词提取
@@ -300,6 +343,20 @@ class TestAPI(unittest.TestCase):
         result = TextProcessingAPI.process_matrix(matrix, pipeline)
         self.assertEqual(result, [2, 5, 8])
 
+    def test_batch_matrix_ops(self):
+        matrix = [
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9]
+        ]
+
+        # 批量操作：删除第二行 -> 删除第二列
+        result = TextProcessingAPI.batch_matrix_ops(matrix, [
+            ("matrix_row", {"operation": "delete", "index": 1}),
+            ("matrix_col", {"operation": "delete", "index": 1})
+        ])
+        self.assertEqual(result, [[1, 3], [7, 9]])
+
     def test_api_matrix_operations(self):
         matrix = [
             [1, 2, 3],
@@ -12,6 +12,7 @@ from .core import (
     TextProcessor,
     ProcessorDecorator,
     LoggingDecorator,
+    CacheDecorator,
     CompositeProcessor,
     ProcessorFactory,
     TextCleaner,
@@ -43,6 +44,7 @@ from .matrix_handlers import (
     MatrixSortProcessor,
     MatrixConverter,
     MatrixAggregator,
+    MatrixBatchProcessor,
     MatrixReshaper,
     CSVToMatrixProcessor
 )
@@ -66,33 +68,27 @@ from .exceptions import (
 from .api import TextProcessingAPI
 
 # 注册核心文本处理器
-ProcessorFactory.register("clean", TextCleaner)
-ProcessorFactory.register("tokenize", TextTokenizer)
-ProcessorFactory.register("word_count", WordCounter)
-ProcessorFactory.register("keywords", KeywordExtractor)
+ProcessorFactory.lazy_register("clean", TextCleaner)
+ProcessorFactory.lazy_register("tokenize", TextTokenizer)
+ProcessorFactory.lazy_register("word_count", WordCounter)
+ProcessorFactory.lazy_register("keywords", KeywordExtractor)
 
-# 注册文件处理器
-ProcessorFactory.register("text_file", TextFileReader)
-ProcessorFactory.register("csv_file", CSVFileReader)
-ProcessorFactory.register("csv_extract", CSVColumnExtractor)
-ProcessorFactory.register("multi_column_csv", MultiColumnCSVReader)
-ProcessorFactory.register("file_to_text", FileContentToText)
-ProcessorFactory.register("csv_to_matrix_file", CSVToMatrix)
-ProcessorFactory.register("file_metadata", FileMetadataExtractor)
-ProcessorFactory.register("csv_content_to_matrix", CSVContentToMatrix)
-ProcessorFactory.register("batch_processor", FileBatchProcessor)
+# 文件处理器由FileProcessor.__init_subclass__在类定义时自动注册，
+# 只有不继承FileProcessor的内容处理器需要在此登记
+ProcessorFactory.lazy_register("csv_content_to_matrix", CSVContentToMatrix)
 
 # 注册矩阵处理器
-ProcessorFactory.register("matrix_row", MatrixRowProcessor)
-ProcessorFactory.register("matrix_col", MatrixColumnProcessor)
-ProcessorFactory.register("matrix_element", MatrixElementProcessor)
-ProcessorFactory.register("matrix_transpose", MatrixTransposeProcessor)
-ProcessorFactory.register("matrix_filter", MatrixFilterProcessor)
-ProcessorFactory.register("matrix_sort", MatrixSortProcessor)
-ProcessorFactory.register("matrix_convert", MatrixConverter)
-ProcessorFactory.register("matrix_aggregate", MatrixAggregator)
-ProcessorFactory.register("matrix_reshape", MatrixReshaper)
-ProcessorFactory.register("csv_to_matrix", CSVToMatrixProcessor)
+ProcessorFactory.lazy_register("matrix_row", MatrixRowProcessor)
+ProcessorFactory.lazy_register("matrix_col", MatrixColumnProcessor)
+ProcessorFactory.lazy_register("matrix_element", MatrixElementProcessor)
+ProcessorFactory.lazy_register("matrix_transpose", MatrixTransposeProcessor)
+ProcessorFactory.lazy_register("matrix_filter", MatrixFilterProcessor)
+ProcessorFactory.lazy_register("matrix_sort", MatrixSortProcessor)
+ProcessorFactory.lazy_register("matrix_convert", MatrixConverter)
+ProcessorFactory.lazy_register("matrix_aggregate", MatrixAggregator)
+ProcessorFactory.lazy_register("matrix_batch", MatrixBatchProcessor)
+ProcessorFactory.lazy_register("matrix_reshape", MatrixReshaper)
+ProcessorFactory.lazy_register("csv_to_matrix", CSVToMatrixProcessor)
 
 # 设置库版本
 __version__ = "1.0.0"
@@ -101,6 +97,7 @@ __version__ = "1.0.0"
 __all__ = [
     "TextProcessingAPI",
     "TextProcessor",
+    "CacheDecorator",
     "ProcessorFactory",
     "TextCleaner",
     "TextTokenizer",
@@ -123,6 +120,7 @@ __all__ = [
     "MatrixSortProcessor",
     "MatrixConverter",
     "MatrixAggregator",
+    "MatrixBatchProcessor",
     "MatrixReshaper",
     "TextProcessingError",
     "UnsupportedFileTypeError",
@@ -1,12 +1,75 @@
 import csv
+import mimetypes
 import os
+from functools import lru_cache
 from io import StringIO
 from typing import List, Any
 
 from .core import ProcessorFactory, CompositeProcessor
 from .exceptions import UnsupportedFileTypeError
 from .file_handlers import FileProcessor
-from .matrix_handlers import MatrixValidator
+from .matrix_handlers import (
+    MatrixValidator, MatrixRowProcessor,
+    MatrixColumnProcessor, MatrixElementProcessor
+)
+
+# 扩展名到文件类型的映射（用于process_file的自动检测）
+_EXT_MAP = {
+    '.csv': 'csv',
+    '.txt': 'text',
+    '.md': 'text',
+    '.log': 'text',
+    '.json': 'text',
+    '.xml': 'text',
+    '.yml': 'text',
+    '.yaml': 'text',
+}
+
+# list_available_processors的结果缓存，连同生成它时的注册表版本号；
+# 任何途径的注册（register/lazy_register/__init_subclass__自动注册）
+# 都会使版本号前进，缓存随之失效
+_processor_names = None
+_processor_names_version = -1
+
+# 以文件路径为输入的处理器名称（用于判断管道是否已包含文件读取步骤）
+_FILE_READER_NAMES = frozenset({
+    'text_file', 'csv_file', 'csv_extract', 'multi_column_csv',
+    'file_to_text', 'csv_to_matrix_file', 'file_metadata',
+})
+
+
+@lru_cache(maxsize=256)
+def _build_processors(ops_key: tuple) -> tuple:
+    """
+    根据规范化的操作键构建处理器元组（带缓存）
+
+    :param ops_key: ((processor_name, ((param, value), ...)), ...) 形式的操作键
+    :return: 按顺序实例化的处理器元组
+    """
+    return tuple(
+        ProcessorFactory.create(name, **dict(param_items))
+        for name, param_items in ops_key
+    )
+
+
+def _build_pipeline(ops_key: tuple, enable_logging: bool) -> CompositeProcessor:
+    """
+    构建处理管道
+
+    缓存的是不可变的处理器元组；管道对象每次新建（开销只是一个
+    空列表加若干append），因此调用方可以放心对返回的管道add()，
+    不会污染后续相同配置的调用。
+    """
+    try:
+        processors = _build_processors(ops_key)
+    except TypeError:
+        # 参数值不可哈希（例如列表）时跳过缓存，直接构建
+        processors = _build_processors.__wrapped__(ops_key)
+
+    pipeline = CompositeProcessor(enable_decorators=enable_logging)
+    for processor in processors:
+        pipeline.add(processor)
+    return pipeline
 
 
 class TextProcessingAPI:
@@ -21,24 +84,28 @@ class TextProcessingAPI:
                           可以是字符串或元组 (processor_name, params_dict)
         :param enable_logging: 是否启用处理日志
         :param kwargs: 处理器配置参数
-        :return: 可执行的处理管道
+        :return: 可执行的处理管道（每次调用返回新管道，内部处理器按配置缓存复用）
         """
-        pipeline = CompositeProcessor(enable_decorators=enable_logging)
+        ops_key = []
         for op in operations:
             # 检查操作是否是元组 (processor_name, params)
             if isinstance(op, (list, tuple)) and len(op) == 2:
                 name, op_params = op
-                # 合并全局参数和操作特定参数
-                params = {**kwargs, **op_params}
+                # 合并全局参数和操作特定参数；某一侧为空时直接复用，免去新建字典
+                if not kwargs:
+                    params = op_params
+                elif not op_params:
+                    params = kwargs
+                else:
+                    params = {**kwargs, **op_params}
             else:
                 name = op
                 params = kwargs
 
-            # 创建处理器并添加到管道
-            processor = ProcessorFactory.create(name, **params)
-            pipeline.add(processor)
+            # 规范化为可哈希的操作键
+            ops_key.append((name, tuple(sorted(params.items()))))
 
-        return pipeline
+        return _build_pipeline(tuple(ops_key), enable_logging)
 
     @staticmethod
     def process_text(text: str, pipeline: list, **kwargs) -> Any:
@@ -68,37 +135,51 @@ class TextProcessingAPI:
             raise ValueError("文件路径无效或为空")
         # 自动检测文件类型
         if file_type is None:
-            if file_path.endswith('.csv'):
-                file_type = 'csv'
-            elif any(file_path.endswith(ext) for ext in ['.txt', '.md', '.log']):
-                file_type = 'text'
-            else:
-                # 尝试获取文件扩展名
+            # 扩展名查表，单次splitext即可覆盖常见情况
+            ext = os.path.splitext(file_path)[1].lower()
+            file_type = _EXT_MAP.get(ext)
+
+            if file_type is None:
+                # 扩展名未知时尝试MIME类型推断（无需读文件）
+                mime_type = mimetypes.guess_type(file_path)[0]
+                if mime_type == 'text/csv':
+                    file_type = 'csv'
+                elif mime_type is not None and mime_type.startswith('text/'):
+                    file_type = 'text'
+
+            if file_type is None:
+                # 最后手段：读取样本并用csv.Sniffer嗅探。
+                # 单行样本没有可供比对的第二行，Sniffer会把普通文章里的
+                # 逗号当成分隔符，因此只在样本含换行时才信任嗅探结果
                 try:
-                    ext = os.path.splitext(file_path)[1].lower()
-                    if ext in ['.json', '.xml', '.yml', '.yaml']:
-                        file_type = 'text'
-                    else:
-                        # 尝试读取文件内容进行检测
-                        with open(file_path, 'rb') as f:
-                            header = f.read(1024)
-                            if b',' in header and b'\n' in header:
-                                file_type = 'csv'
-                            else:
-                                file_type = 'text'
+                    with open(file_path, 'r', errors='replace') as f:
+                        sample = f.read(1024)
+                    file_type = 'text'
+                    if '\n' in sample:
+                        try:
+                            csv.Sniffer().sniff(sample, delimiters=',\t;')
+                            file_type = 'csv'
+                        except csv.Error:
+                            pass
                 except Exception:
                     raise UnsupportedFileTypeError(f"无法识别的文件类型: {file_path}")
 
-        # 根据文件类型创建处理链
-        if file_type == 'csv':
-            # 对于CSV，首先添加文件阅读器，然后添加列提取器
-            full_pipeline = [('csv_file', kwargs), ('csv_extract', kwargs)] + pipeline
+        # 判断管道首步是否已经是文件读取器，避免重复添加
+        first_op = pipeline[0] if pipeline else None
+        if isinstance(first_op, (list, tuple)) and len(first_op) == 2:
+            first_op = first_op[0]
+
+        if first_op in _FILE_READER_NAMES:
+            full_pipeline = pipeline
+        elif file_type == 'csv':
+            # 对于CSV，添加CSV文件阅读器
+            full_pipeline = ['csv_file'] + list(pipeline)
         else:
-            # 对于文本文件，添加文件阅读器
-            full_pipeline = [('text_file', kwargs)] + pipeline
+            # 对于文本文件，添加文本文件阅读器
+            full_pipeline = ['text_file'] + list(pipeline)
 
         # 创建处理管道
-        pipe = TextProcessingAPI.create_pipeline(pipeline, ** kwargs)
+        pipe = TextProcessingAPI.create_pipeline(full_pipeline, **kwargs)
         return pipe.process(file_path)
 
     @staticmethod
@@ -116,6 +197,21 @@ class TextProcessingAPI:
         pipe = TextProcessingAPI.create_pipeline(pipeline, **kwargs)
         return pipe.process(matrix)
 
+    @staticmethod
+    def batch_matrix_ops(matrix: List[List[Any]], operations: list, **kwargs) -> Any:
+        """
+        对矩阵批量执行一系列操作
+
+        与逐个调用便捷方法相比，只需一次调用即可执行整串操作，
+        中间结果直接在步骤间传递；各步骤照常自行校验输入。
+
+        :param matrix: 输入的二维矩阵
+        :param operations: 处理步骤列表，例如 [("matrix_row", {...}), ...]
+        :param kwargs: 处理器配置参数
+        :return: 处理结果
+        """
+        return TextProcessingAPI.process_matrix(matrix, operations, **kwargs)
+
     @staticmethod
     def matrix_to_csv(matrix: List[List[Any]], delimiter: str = ',') -> str:
         """
@@ -125,6 +221,22 @@ class TextProcessingAPI:
         :param delimiter: CSV分隔符，默认为逗号
         :return: CSV格式的字符串
         """
+        if not matrix:
+            return ""
+
+        # 快速路径：单元格不含分隔符/引号/换行时直接用join拼接，
+        # 避免csv.writer逐单元格的引用判断开销
+        lines = []
+        for row in matrix:
+            cells = [str(cell) for cell in row]
+            if any(delimiter in c or '"' in c or '\r' in c or '\n' in c
+                   for c in cells):
+                break
+            lines.append(delimiter.join(cells))
+        else:
+            return "\r\n".join(lines) + "\r\n"
+
+        # 回退路径：需要转义时交给csv.writer处理
         output = StringIO()
         writer = csv.writer(output, delimiter=delimiter)
         writer.writerows(matrix)
@@ -132,13 +244,23 @@ class TextProcessingAPI:
 
     @staticmethod
     def list_available_processors() -> List[str]:
-        """列出所有可用的处理器名称"""
-        return list(ProcessorFactory._registry.keys())
+        """列出所有可用的处理器名称（包括延迟注册的处理器）"""
+        global _processor_names, _processor_names_version
+        version = ProcessorFactory._version
+        if _processor_names is None or _processor_names_version != version:
+            _processor_names = sorted(
+                ProcessorFactory._registry.keys() | ProcessorFactory._lazy_registry.keys()
+            )
+            _processor_names_version = version
+        return list(_processor_names)
 
     @staticmethod
     def register_processor(name: str, processor_cls):
         """注册新的处理器类型"""
         ProcessorFactory.register(name, processor_cls)
+        # 注册可能覆盖已有处理器，清空已缓存的处理器元组；
+        # 名称列表缓存由注册表版本号自动失效
+        _build_processors.cache_clear()
 
     @staticmethod
     def set_logging(enabled: bool):
@@ -155,10 +277,7 @@ class TextProcessingAPI:
         :param row_index: 行索引
         :return: 指定行的数据
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_row", {"operation": "get", "index": row_index})]
-        )
+        return MatrixRowProcessor(operation="get", index=row_index).process(matrix)
 
     @staticmethod
     def get_matrix_column(matrix: List[List[Any]], column_index: int) -> List[Any]:
@@ -169,10 +288,7 @@ class TextProcessingAPI:
         :param column_index: 列索引
         :return: 指定列的数据
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_col", {"operation": "get", "index": column_index})]
-        )
+        return MatrixColumnProcessor(operation="get", index=column_index).process(matrix)
 
     @staticmethod
     def add_matrix_row(matrix: List[List[Any]], row_data: List[Any]) -> List[List[Any]]:
@@ -183,10 +299,7 @@ class TextProcessingAPI:
         :param row_data: 要添加的行数据
         :return: 添加行后的新矩阵
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_row", {"operation": "add", "row": row_data})]
-        )
+        return MatrixRowProcessor(operation="add", row=row_data).process(matrix)
 
     @staticmethod
     def update_matrix_row(matrix: List[List[Any]], row_index: int, row_data: List[Any]) -> List[List[Any]]:
@@ -198,10 +311,7 @@ class TextProcessingAPI:
         :param row_data: 新的行数据
         :return: 更新后的矩阵
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_row", {"operation": "update", "index": row_index, "row": row_data})]
-        )
+        return MatrixRowProcessor(operation="update", index=row_index, row=row_data).process(matrix)
 
     @staticmethod
     def delete_matrix_row(matrix: List[List[Any]], row_index: int) -> List[List[Any]]:
@@ -212,10 +322,7 @@ class TextProcessingAPI:
         :param row_index: 行索引
         :return: 删除行后的新矩阵
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_row", {"operation": "delete", "index": row_index})]
-        )
+        return MatrixRowProcessor(operation="delete", index=row_index).process(matrix)
 
     @staticmethod
     def add_matrix_column(matrix: List[List[Any]], column_data: List[Any]) -> List[List[Any]]:
@@ -226,10 +333,7 @@ class TextProcessingAPI:
         :param column_data: 要添加的列数据
         :return: 添加列后的新矩阵
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_col", {"operation": "add", "column": column_data})]
-        )
+        return MatrixColumnProcessor(operation="add", column=column_data).process(matrix)
 
     @staticmethod
     def update_matrix_column(matrix: List[List[Any]], column_index: int, column_data: List[Any]) -> List[List[Any]]:
@@ -241,10 +345,7 @@ class TextProcessingAPI:
         :param column_data: 新的列数据
         :return: 更新后的矩阵
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_col", {"operation": "update", "index": column_index, "column": column_data})]
-        )
+        return MatrixColumnProcessor(operation="update", index=column_index, column=column_data).process(matrix)
 
     @staticmethod
     def delete_matrix_column(matrix: List[List[Any]], column_index: int) -> List[List[Any]]:
@@ -255,10 +356,7 @@ class TextProcessingAPI:
         :param column_index: 列索引
         :return: 删除列后的新矩阵
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_col", {"operation": "delete", "index": column_index})]
-        )
+        return MatrixColumnProcessor(operation="delete", index=column_index).process(matrix)
 
     @staticmethod
     def get_matrix_element(matrix: List[List[Any]], row_index: int, column_index: int) -> Any:
@@ -270,10 +368,7 @@ class TextProcessingAPI:
         :param column_index: 列索引
         :return: 指定位置的元素值
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_element", {"operation": "get", "row": row_index, "column": column_index})]
-        )
+        return MatrixElementProcessor(operation="get", row=row_index, column=column_index).process(matrix)
 
     @staticmethod
     def update_matrix_element(matrix: List[List[Any]], row_index: int, column_index: int, value: Any) -> List[List[Any]]:
@@ -286,7 +381,4 @@ class TextProcessingAPI:
         :param value: 新的元素值
         :return: 更新后的矩阵
         """
-        return TextProcessingAPI.process_matrix(
-            matrix,
-            [("matrix_element", {"operation": "update", "row": row_index, "column": column_index, "value": value})]
-        )
+        return MatrixElementProcessor(operation="update", row=row_index, column=column_index, value=value).process(matrix)
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
+from collections import Counter
+
 from .exceptions import ProcessorNotFoundError, InvalidInputError
 
 
 class TextProcessor(ABC):
     """文本处理器抽象基类"""
 
+    # 整个继承链声明__slots__后实例不再携带__dict__，
+    # 属性访问更快且大批量创建时内存占用更小
+    __slots__ = ()
+
     @abstractmethod
     def process(self, input_data: str):
         pass
@@ -12,9 +18,15 @@ class TextProcessor(ABC):
 
 class LoggingDecorator(TextProcessor):
     """日志装饰器实现"""
+    __slots__ = ('_wrapped',)
+
     _logging_enabled = True
 
     def __init__(self, wrapped: TextProcessor):
+        # 已是日志装饰器时直接接管其内层处理器，嵌套包装只会把同一份
+        # 日志打两遍并加深热路径的调用栈
+        if isinstance(wrapped, LoggingDecorator):
+            wrapped = wrapped._wrapped
         self._wrapped = wrapped
 
     @classmethod
@@ -22,67 +34,140 @@ class LoggingDecorator(TextProcessor):
         cls._logging_enabled = enabled
 
     def process(self, input_data: str):
-        if self._logging_enabled:
-            print(f"[LOG] Entering: {type(self._wrapped).__name__}")
-            print(f"[LOG] Input: {input_data[:50]}{'...' if len(input_data) > 50 else ''}")
+        # 日志关闭时直接转发，跳过所有格式化开销
+        if not self._logging_enabled:
+            return self._wrapped.process(input_data)
+
+        # 处理器名只查找一次，结果只字符串化一次
+        name = type(self._wrapped).__name__
+        print(f"[LOG] Entering: {name}")
+        print(f"[LOG] Input: {input_data[:50]}{'...' if len(input_data) > 50 else ''}")
 
         result = self._wrapped.process(input_data)
 
-        if self._logging_enabled:
-            print(f"[LOG] Result: {str(result)[:50]}{'...' if len(str(result)) > 50 else ''}")
-            print(f"[LOG] Exiting: {type(self._wrapped).__name__}")
+        result_str = str(result)
+        print(f"[LOG] Result: {result_str[:50]}{'...' if len(result_str) > 50 else ''}")
+        print(f"[LOG] Exiting: {name}")
         return result
 
 
 ProcessorDecorator = LoggingDecorator  # 保持别名兼容性
 
+_CACHE_MISS = object()  # 区分"未缓存"与缓存的None结果
+
+
+class CacheDecorator(TextProcessor):
+    """
+    结果缓存装饰器
+
+    以输入本身为键记忆被包装处理器的结果，适合对重复输入反复调用的
+    纯函数处理器（如清洗、分词）。注意：命中时返回的是同一个结果
+    对象，调用方不应修改；不可哈希的输入（如矩阵）直接透传。
+    """
+
+    __slots__ = ('_wrapped', '_cache')
+
+    MAX_ENTRIES = 128
+
+    def __init__(self, wrapped: TextProcessor):
+        self._wrapped = wrapped
+        self._cache = {}
+
+    def process(self, input_data):
+        # 输入本身作键：dict查找已是哈希+相等双重判定，
+        # 不会像裸hash键那样把碰撞的不同输入混为一谈
+        try:
+            result = self._cache.get(input_data, _CACHE_MISS)
+        except TypeError:
+            return self._wrapped.process(input_data)
+
+        if result is not _CACHE_MISS:
+            return result
+
+        result = self._wrapped.process(input_data)
+        if len(self._cache) < self.MAX_ENTRIES:
+            self._cache[input_data] = result
+        return result
+
+    def clear_cache(self):
+        """清空缓存结果"""
+        self._cache.clear()
+
 
 class CompositeProcessor(TextProcessor):
     """组合模式实现"""
 
+    __slots__ = ('processors', 'enable_decorators', '_compiled')
+
     def __init__(self, enable_decorators=False):
         self.processors = []
         self.enable_decorators = enable_decorators
+        self._compiled = None
 
     def add(self, processor: TextProcessor):
         """添加处理器到处理链"""
-        if self.enable_decorators:
-            self.processors.append(LoggingDecorator(processor))
+        # 已经带日志装饰的处理器无需再包一层
+        if self.enable_decorators and not isinstance(processor, LoggingDecorator):
+            processor = LoggingDecorator(processor)
+        self.processors.append(processor)
+        self._compiled = None  # 处理链变化后需重新特化
+
+    def compile(self):
+        """
+        将处理链特化为单个可调用对象
+
+        绑定方法只查找一次，单处理器管道直接退化为该处理器的process，
+        消除热路径上的逐步属性查找与额外调用帧。
+        """
+        funcs = tuple(processor.process for processor in self.processors)
+        if len(funcs) == 1:
+            self._compiled = funcs[0]
         else:
-            self.processors.append(processor)
+            def _run(data, _funcs=funcs):
+                for func in _funcs:
+                    data = func(data)
+                return data
+            self._compiled = _run
+        return self._compiled
 
     def process(self, input_data: str):
         """执行处理链中的所有处理器"""
-        current_data = input_data
-        for processor in self.processors:
-            current_data = processor.process(current_data)
-        return current_data
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.compile()
+        return compiled(input_data)
 
 
 class ProcessorFactory:
     _registry = {}
     _lazy_registry = {}
+    # 每次注册递增，供外部缓存（如名称列表）判断注册表是否已变化
+    _version = 0
 
     @classmethod
     def register(cls, name: str, processor_cls):
         """注册新处理器类型"""
         cls._registry[name] = processor_cls
+        cls._version += 1
 
     @classmethod
     def lazy_register(cls, name: str, processor_cls):
         """延迟注册处理器类型"""
         cls._lazy_registry[name] = processor_cls
+        cls._version += 1
 
     @classmethod
     def create(cls, name: str, **kwargs) -> TextProcessor:
         """创建处理器实例"""
-        if name in cls._lazy_registry:
-            cls.register(name, cls._lazy_registry[name])
-            del cls._lazy_registry[name]
-
-        if name not in cls._registry:
-            raise ProcessorNotFoundError(f"未知处理器: {name}")
-        return cls._registry[name](**kwargs)
+        # 快速路径：已注册的处理器只需一次字典查找
+        processor_cls = cls._registry.get(name)
+        if processor_cls is None:
+            # pop把"存在性检查+取值+删除"合并为一次查找
+            processor_cls = cls._lazy_registry.pop(name, None)
+            if processor_cls is None:
+                raise ProcessorNotFoundError(f"未知处理器: {name}")
+            cls._registry[name] = processor_cls
+        return processor_cls(**kwargs)
 
     @classmethod
     def get_registry(cls):
@@ -99,23 +184,55 @@ class ProcessorFactory:
         return self._registry
 
 
+class _DeleteTable(dict):
+    """
+    按需扩展的字符删除表
+
+    非字母数字且非空白的码点映射为None（删除），其余映射为自身。
+    首次遇到的码点在__missing__中计算并缓存，之后都是字典命中。
+    """
+
+    def __missing__(self, code_point):
+        ch = chr(code_point)
+        result = code_point if (ch.isalnum() or ch.isspace()) else None
+        self[code_point] = result
+        return result
+
+
+# 预填充ASCII范围，常见输入无需走__missing__
+_DELETE_TABLE = _DeleteTable(
+    (cp, cp if (chr(cp).isalnum() or chr(cp).isspace()) else None)
+    for cp in range(128)
+)
+
+
 class TextCleaner(TextProcessor):
+    __slots__ = ()
+
     def process(self, text: str):
-        return ''.join(c for c in text if c.isalnum() or c.isspace())
+        # str.translate在单次C循环内完成过滤，逐字符谓词开销按码点摊销
+        return text.translate(_DELETE_TABLE)
 
 
 class TextTokenizer(TextProcessor):
+    __slots__ = ()
+
     def process(self, text: str):
         return text.split()
 
 
 class WordCounter(TextProcessor):
+    __slots__ = ()
+
     def process(self, text: str):
-        words = text.split()
-        return {word: words.count(word) for word in set(words)}
+        # Counter单遍计数；Counter本身就是dict子类，直接返回省去一次拷贝
+        # 且下游可直接使用most_common()
+        return Counter(text.split())
 
 
 class KeywordExtractor(TextProcessor):
+    __slots__ = ('top_k',)
+
     def __init__(self, top_k=5):
         self.top_k = top_k
 
@@ -132,8 +249,6 @@ class KeywordExtractor(TextProcessor):
                 str(type(input_data))
             )
 
-        freq = {}
-        for word in words:
-            freq[word] = freq.get(word, 0) + 1
-        sorted_words = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_words[:self.top_k]]
\ No newline at end of file
+        # Counter在C层计数，most_common用堆做部分排序（O(n log k)）
+        freq = Counter(words)
+        return [word for word, _ in freq.most_common(self.top_k)]
\ No newline at end of file
@@ -1,4 +1,6 @@
-import json
+import csv
+from io import StringIO
+from operator import itemgetter
 from typing import List, Any, Optional, Dict
 
 from .core import TextProcessor
@@ -14,12 +16,29 @@ class MatrixValidator:
     @staticmethod
     def validate_matrix(matrix: List[List[Any]]):
         """验证矩阵格式是否正确"""
-        if not isinstance(matrix, list):
+        # type恒等比较比isinstance快得多，且每次处理器调用都要过这里；
+        # list子类走isinstance回退，保持原有接受范围
+        if type(matrix) is not list and not isinstance(matrix, list):
             raise MatrixOperationError("validate", "输入必须是列表")
-        if not all(isinstance(row, list) for row in matrix):
+        if not matrix:
+            return
+
+        # O(1)首行类型守卫：首行是list时才走免扫描快速路径；
+        # 否则退回整趟isinstance检查，字符串/元组等有len的非列表行
+        # 不会漏过（它们能通过下面的矩形检查却会产生错误结果）
+        if type(matrix[0]) is not list:
+            if not all(isinstance(row, list) for row in matrix):
+                raise MatrixOperationError("validate", "矩阵的每一行必须是列表")
+
+        # 矩形检查顺带兜底剩余的行类型问题：无len的行在此自然失败
+        try:
+            rectangular = len({len(row) for row in matrix}) == 1
+        except TypeError:
             raise MatrixOperationError("validate", "矩阵的每一行必须是列表")
-            # 检查行长度一致性
-        if matrix:
+
+        # 快速路径：行长度集合大小为1即为矩形，全程C层计算
+        if not rectangular:
+            # 慢速路径：仅在校验失败时定位首个不一致的行用于报错
             first_row_len = len(matrix[0])
             for i, row in enumerate(matrix[1:], start=1):
                 if len(row) != first_row_len:
@@ -27,60 +46,103 @@ class MatrixValidator:
                                                 f"第{i}行的长度({len(row)})与第一行长度({first_row_len})不一致")
 
     @staticmethod
-    def validate_row_index(matrix: List[List[Any]], index: int):
-        """验证行索引是否有效"""
-        if index < 0 or index >= len(matrix):
+    def validate_row_index(matrix: List[List[Any]], index: int,
+                           num_rows: Optional[int] = None):
+        """验证行索引是否有效（调用方可传入已算好的行数）"""
+        if num_rows is None:
+            num_rows = len(matrix)
+        if index < 0 or index >= num_rows:
             raise IndexOutOfBoundsError(
                 operation="row_access",
                 index=index,
-                max_index=len(matrix),
+                max_index=num_rows,
                 dimension_type="row"
             )
 
     @staticmethod
-    def validate_column_index(matrix: List[List[Any]], index: int):
-        """验证列索引是否有效"""
-        if not matrix:
-            return
-        if index < 0 or index >= len(matrix[0]):
+    def validate_column_index(matrix: List[List[Any]], index: int,
+                              num_cols: Optional[int] = None):
+        """验证列索引是否有效（调用方可传入已算好的列数）"""
+        if num_cols is None:
+            if not matrix:
+                return
+            num_cols = len(matrix[0])
+        if index < 0 or index >= num_cols:
             raise IndexOutOfBoundsError(
                 operation="column_access",
                 index=index,
-                max_index=len(matrix[0]),
+                max_index=num_cols,
                 dimension_type="column"
             )
 
     @staticmethod
     def validate_element_index(matrix: List[List[Any]], row_index: int, col_index: int):
         """验证元素索引是否有效"""
-        MatrixValidator.validate_row_index(matrix, row_index)
-        MatrixValidator.validate_column_index(matrix, col_index)
+        # 两个维度各算一次长度，传给下层复用
+        MatrixValidator.validate_row_index(matrix, row_index,
+                                           num_rows=len(matrix))
+        if matrix:
+            MatrixValidator.validate_column_index(matrix, col_index,
+                                                  num_cols=len(matrix[0]))
 
     @staticmethod
-    def validate_row_length(matrix: List[List[Any]], row_data: List[Any]):
-        if matrix and len(row_data) != len(matrix[0]):  # matrix 非空检查
+    def validate_row_length(matrix: List[List[Any]], row_data: List[Any],
+                            num_cols: Optional[int] = None):
+        if not matrix:  # matrix 非空检查
+            return
+        if num_cols is None:
+            num_cols = len(matrix[0])
+        if len(row_data) != num_cols:
             raise DimensionMismatchError(
                 operation="row_operation",
-                expected_dimension=len(matrix[0]),
+                expected_dimension=num_cols,
                 actual_dimension=len(row_data),
                 dimension_type="column"
             )
 
     @staticmethod
-    def validate_column_length(matrix: List[List[Any]], column_data: List[Any]):
+    def validate_column_length(matrix: List[List[Any]], column_data: List[Any],
+                               num_rows: Optional[int] = None):
         """验证列长度是否匹配矩阵行数"""
-        if matrix and len(column_data) != len(matrix):
+        if not matrix:
+            return
+        if num_rows is None:
+            num_rows = len(matrix)
+        if len(column_data) != num_rows:
             raise DimensionMismatchError(
                 operation="column_operation",
-                expected_dimension=len(matrix),
+                expected_dimension=num_rows,
                 actual_dimension=len(column_data),
                 dimension_type="row"
             )
 
 
+def _check_required_params(processor, processor_name: str):
+    """按处理器的_REQUIRED参数表校验当前操作的必填参数"""
+    for param in processor._REQUIRED[processor.operation]:
+        if getattr(processor, param) is None:
+            raise ParameterError(
+                processor_name=processor_name,
+                parameter=param,
+                value=None,
+                expected=f"non-None value for '{processor.operation}' operation"
+            )
+
+
 class MatrixRowProcessor(TextProcessor):
     """矩阵行操作处理器"""
 
+    __slots__ = ('operation', 'index', 'row')
+
+    # 各操作的必填参数表：process入口统一校验，
+    # 取代散落在每个操作方法里的None检查
+    _REQUIRED = {
+        'get': ('index',),
+        'add': ('row',),
+        'update': ('index', 'row'),
+        'delete': ('index',),
+    }
+
     def __init__(self, operation: str, index: Optional[int] = None,
                  row: Optional[List[Any]] = None):
         """
@@ -105,6 +167,7 @@ class MatrixRowProcessor(TextProcessor):
     def process(self, matrix: List[List[Any]]) -> Any:
         """执行行操作"""
         MatrixValidator.validate_matrix(matrix)
+        _check_required_params(self, "MatrixRowProcessor")
 
         if self.operation == 'get':
             return self._get_row(matrix)
@@ -117,76 +180,52 @@ class MatrixRowProcessor(TextProcessor):
 
     def _get_row(self, matrix: List[List[Any]]) -> List[Any]:
         """获取指定行"""
-        if self.index is None:
-            raise ParameterError(
-                processor_name="MatrixRowProcessor",
-                parameter="index",
-                value=None,
-                expected="non-None value for 'get' operation"
-            )
-
         MatrixValidator.validate_row_index(matrix, self.index)
         return matrix[self.index]
 
     def _add_row(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """添加新行"""
-        if self.row is None:
-            raise ParameterError(
-                processor_name="MatrixRowProcessor",
-                parameter="row",
-                value=None,
-                expected="non-None value for 'add' operation"
-            )
-
         if matrix:  # 非空矩阵才验证长度
             MatrixValidator.validate_row_length(matrix, self.row)
 
-        # 创建新矩阵的副本（避免修改原始矩阵）
-        new_matrix = [r[:] for r in matrix]  # 复制所有行
+        # 只复制外层列表：未改动的行按引用共享（行操作从不原地修改行），
+        # 省去O(R·C)的整行复制
+        new_matrix = list(matrix)
         new_matrix.append(self.row[:])  # 添加新行
         return new_matrix
 
     def _update_row(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """更新指定行"""
-        if self.index is None or self.row is None:
-            raise ParameterError(
-                processor_name="MatrixRowProcessor",
-                parameter="index or row",
-                value=None,
-                expected="non-None values for 'update' operation"
-            )
-
         MatrixValidator.validate_row_index(matrix, self.index)
         MatrixValidator.validate_row_length(matrix, self.row)
 
-        # 创建新矩阵的副本（避免修改原始矩阵）
-        new_matrix = [r[:] for r in matrix]  # 复制所有行
+        # 只复制外层列表，未改动的行按引用共享
+        new_matrix = list(matrix)
         new_matrix[self.index] = self.row[:]  # 更新指定行
         return new_matrix
 
     def _delete_row(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """删除指定行"""
-        if self.index is None:
-            raise ParameterError(
-                processor_name="MatrixRowProcessor",
-                parameter="index",
-                value=None,
-                expected="non-None value for 'delete' operation"
-            )
-
         MatrixValidator.validate_row_index(matrix, self.index)
 
-        # 创建新矩阵的副本（避免修改原始矩阵）
-        new_matrix = []
-        for i, row in enumerate(matrix):
-            if i != self.index:
-                new_matrix.append(row[:])  # 复制行
+        # 只复制外层列表再删除目标位置，保留的行按引用共享
+        new_matrix = list(matrix)
+        del new_matrix[self.index]
         return new_matrix
 
 
 class MatrixColumnProcessor(TextProcessor):
     """矩阵列操作处理器"""
 
+    __slots__ = ('operation', 'index', 'column')
+
+    _REQUIRED = {
+        'get': ('index',),
+        'add': ('column',),
+        'update': ('index', 'column'),
+        'delete': ('index',),
+    }
+
     def __init__(self, operation: str, index: Optional[int] = None,
                  column: Optional[List[Any]] = None):
         """
@@ -211,6 +250,7 @@ class MatrixColumnProcessor(TextProcessor):
     def process(self, matrix: List[List[Any]]) -> Any:
         """执行列操作"""
         MatrixValidator.validate_matrix(matrix)
+        _check_required_params(self, "MatrixColumnProcessor")
 
         if self.operation == 'get':
             return self._get_column(matrix)
@@ -223,89 +263,56 @@ class MatrixColumnProcessor(TextProcessor):
 
     def _get_column(self, matrix: List[List[Any]]) -> List[Any]:
         """获取指定列"""
-        if self.index is None:
-            raise ParameterError(
-                processor_name="MatrixColumnProcessor",
-                parameter="index",
-                value=None,
-                expected="non-None value for 'get' operation"
-            )
-
         MatrixValidator.validate_column_index(matrix, self.index)
-        return [row[self.index] for row in matrix]
+        # itemgetter+map在C层完成整列提取
+        return list(map(itemgetter(self.index), matrix))
 
     def _add_column(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """添加新列"""
-        if self.column is None:
-            raise ParameterError(
-                processor_name="MatrixColumnProcessor",
-                parameter="column",
-                value=None,
-                expected="non-None value for 'add' operation"
-            )
-
         MatrixValidator.validate_column_length(matrix, self.column)
 
-        # 创建新矩阵的副本（避免修改原始矩阵）
-        new_matrix = []
-        for i, row in enumerate(matrix):
-            new_row = row[:]  # 复制行
-            new_row.append(self.column[i])  # 添加新列值
-            new_matrix.append(new_row)
-
         # 处理空矩阵的情况
         if not matrix:
-            new_matrix = [[val] for val in self.column]
+            return [[val] for val in self.column]
 
-        return new_matrix
+        # zip在C层配对行与新列值，行复制与拼接由+的切片实现完成，
+        # 免去enumerate索引和逐元素append
+        return [row + [val] for row, val in zip(matrix, self.column)]
 
     def _update_column(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """更新指定列"""
-        if self.index is None or self.column is None:
-            raise ParameterError(
-                processor_name="MatrixColumnProcessor",
-                parameter="index or column",
-                value=None,
-                expected="non-None values for 'update' operation"
-            )
-
         MatrixValidator.validate_column_index(matrix, self.index)
         MatrixValidator.validate_column_length(matrix, self.column)
 
-        # 创建新矩阵的副本（避免修改原始矩阵）
+        # zip在C层配对行与新列值；索引提升为局部变量
+        idx = self.index
         new_matrix = []
-        for i, row in enumerate(matrix):
+        for row, val in zip(matrix, self.column):
             new_row = row[:]  # 复制行
-            new_row[self.index] = self.column[i]  # 更新列值
+            new_row[idx] = val  # 更新列值
             new_matrix.append(new_row)
         return new_matrix
 
     def _delete_column(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """删除指定列"""
-        if self.index is None:
-            raise ParameterError(
-                processor_name="MatrixColumnProcessor",
-                parameter="index",
-                value=None,
-                expected="non-None value for 'delete' operation"
-            )
-
         MatrixValidator.validate_column_index(matrix, self.index)
 
-        # 创建新矩阵的副本（避免修改原始矩阵）
-        new_matrix = []
-        for row in matrix:
-            new_row = []
-            for j, val in enumerate(row):
-                if j != self.index:
-                    new_row.append(val)
-            new_matrix.append(new_row)
-        return new_matrix
+        # 两段切片拼接代替逐元素的j != index判断：
+        # 切片复制是memcpy级操作，每个单元格省一次Python比较
+        idx = self.index
+        return [row[:idx] + row[idx + 1:] for row in matrix]
 
 
 class MatrixElementProcessor(TextProcessor):
     """矩阵元素操作处理器"""
 
+    __slots__ = ('operation', 'row', 'column', 'value')
+
+    _REQUIRED = {
+        'get': (),
+        'update': ('value',),
+    }
+
     def __init__(self, operation: str, row: int, column: int,
                  value: Optional[Any] = None):
         """
@@ -332,6 +339,7 @@ class MatrixElementProcessor(TextProcessor):
     def process(self, matrix: List[List[Any]]) -> Any:
         """执行元素操作"""
         MatrixValidator.validate_matrix(matrix)
+        _check_required_params(self, "MatrixElementProcessor")
 
         if self.operation == 'get':
             return self._get_element(matrix)
@@ -345,25 +353,22 @@ class MatrixElementProcessor(TextProcessor):
 
     def _update_element(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """更新指定元素"""
-        if self.value is None:
-            raise ParameterError(
-                processor_name="MatrixElementProcessor",
-                parameter="value",
-                value=None,
-                expected="non-None value for 'update' operation"
-            )
-
         MatrixValidator.validate_element_index(matrix, self.row, self.column)
 
-        # 创建新矩阵的副本（避免修改原始矩阵）
-        new_matrix = [r[:] for r in matrix]  # 复制所有行
-        new_matrix[self.row][self.column] = self.value  # 更新元素值
+        # 写时复制：只复制外层列表和被改动的那一行，
+        # 其余行按引用共享，复制量从O(R·C)降为O(R+C)
+        new_matrix = list(matrix)
+        new_row = matrix[self.row][:]
+        new_row[self.column] = self.value  # 更新元素值
+        new_matrix[self.row] = new_row
         return new_matrix
 
 
 class MatrixTransposeProcessor(TextProcessor):
     """矩阵转置处理器"""
 
+    __slots__ = ()
+
     def process(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """转置矩阵（行列互换）"""
         MatrixValidator.validate_matrix(matrix)
@@ -372,22 +377,16 @@ class MatrixTransposeProcessor(TextProcessor):
         if not matrix:
             return []
 
-        # 使用列表推导式进行转置
-        num_rows = len(matrix)
-        num_cols = len(matrix[0])
-
-        # 创建转置后的矩阵
-        transposed = [
-            [matrix[j][i] for j in range(num_rows)]
-            for i in range(num_cols)
-        ]
-
-        return transposed
+        # zip在C层完成行列互换，比逐元素索引的嵌套推导式快数倍
+        return list(map(list, zip(*matrix)))
 
 
 class MatrixFilterProcessor(TextProcessor):
     """矩阵过滤处理器"""
 
+    __slots__ = ('filter_func', 'filter_condition', 'filter_value',
+                 '_row_predicate')
+
     def __init__(self, filter_func: callable = None,
                  filter_condition: str = None,
                  filter_value: Any = None):
@@ -409,6 +408,32 @@ class MatrixFilterProcessor(TextProcessor):
                 expected="at least one filtering method"
             )
 
+        # 构造时就把条件特化为单个行谓词，行循环里不再逐行分派条件分支
+        self._row_predicate = self._build_predicate()
+
+    def _build_predicate(self) -> callable:
+        """根据配置生成行谓词（每个实例只做一次）"""
+        if self.filter_func:
+            return self.filter_func
+
+        value = self.filter_value
+        condition = self.filter_condition
+        if condition == 'equals':
+            # 行中任意元素等于过滤值；in对列表做C层的相等扫描
+            return lambda row: value in row
+        if condition == 'contains':
+            # 行中任意元素包含过滤值（字符串）
+            return lambda row: any(value in str(element) for element in row)
+        if condition == 'greater':
+            # 行中任意元素大于过滤值（数值）
+            return lambda row: any(element > value for element in row)
+        if condition == 'less':
+            # 行中任意元素小于过滤值（数值）
+            return lambda row: any(element < value for element in row)
+
+        # 未知条件默认包含所有行
+        return lambda row: True
+
     def process(self, matrix: List[List[Any]]) -> List[List[Any]]:
         """过滤矩阵，保留满足条件的行"""
         MatrixValidator.validate_matrix(matrix)
@@ -417,41 +442,19 @@ class MatrixFilterProcessor(TextProcessor):
         if not matrix:
             return []
 
-        filtered_matrix = []
-
-        for row in matrix:
-            if self._should_include_row(row):
-                filtered_matrix.append(row)
-
-        return filtered_matrix
+        predicate = self._row_predicate
+        return [row for row in matrix if predicate(row)]
 
     def _should_include_row(self, row: List[Any]) -> bool:
         """判断行是否应该包含在结果中"""
-        if self.filter_func:
-            # 使用自定义过滤函数
-            return self.filter_func(row)
-
-        # 使用预设过滤条件
-        if self.filter_condition == 'equals':
-            # 行中任意元素等于过滤值
-            return any(element == self.filter_value for element in row)
-        elif self.filter_condition == 'contains':
-            # 行中任意元素包含过滤值（字符串）
-            return any(self.filter_value in str(element) for element in row)
-        elif self.filter_condition == 'greater':
-            # 行中任意元素大于过滤值（数值）
-            return any(element > self.filter_value for element in row)
-        elif self.filter_condition == 'less':
-            # 行中任意元素小于过滤值（数值）
-            return any(element < self.filter_value for element in row)
-
-        # 默认包含所有行
-        return True
+        return self._row_predicate(row)
 
 
 class MatrixSortProcessor(TextProcessor):
     """矩阵排序处理器"""
 
+    __slots__ = ('column_index', 'ascending', 'sort_func')
+
     def __init__(self, column_index: int = 0,
                  ascending: bool = True,
                  sort_func: callable = None):
@@ -470,29 +473,29 @@ class MatrixSortProcessor(TextProcessor):
 
         # 如果矩阵为空或只有一行，直接返回
         if len(matrix) <= 1:
-            return [r[:] for r in matrix]  # 返回副本
+            return list(matrix)  # 返回新外层列表，行按引用共享
 
         # 验证列索引
         MatrixValidator.validate_column_index(matrix, self.column_index)
 
-        # 创建矩阵的副本（避免修改原始矩阵）
-        sorted_matrix = [r[:] for r in matrix]
-
-        # 获取排序键
+        # 获取排序键：无自定义函数时itemgetter在C层取键，
+        # 每行省去一次Python级lambda调用
         if self.sort_func:
-            key_func = lambda row: self.sort_func(row[self.column_index])
+            sort_func = self.sort_func
+            column_index = self.column_index
+            key_func = lambda row: sort_func(row[column_index])
         else:
-            key_func = lambda row: row[self.column_index]
+            key_func = itemgetter(self.column_index)
 
-        # 执行排序
-        sorted_matrix.sort(key=key_func, reverse=not self.ascending)
-
-        return sorted_matrix
+        # sorted产生新的外层列表；排序不改动行本身，行按引用共享
+        return sorted(matrix, key=key_func, reverse=not self.ascending)
 
 
 class MatrixConverter(TextProcessor):
     """矩阵转换处理器"""
 
+    __slots__ = ('output_format', 'row_separator', 'col_separator')
+
     def __init__(self, output_format: str = 'list',
                  row_separator: str = '\n',
                  col_separator: str = '\t'):
@@ -520,14 +523,19 @@ class MatrixConverter(TextProcessor):
         MatrixValidator.validate_matrix(matrix)
 
         if self.output_format == 'list':
-            return [r[:] for r in matrix]  # 返回副本
+            # map在C层逐行调用list()复制，比推导式少一层字节码循环
+            return list(map(list, matrix))  # 返回副本
 
         elif self.output_format == 'dict':
             return self._to_dict(matrix)
 
         elif self.output_format == 'json':
-            # 使用已导入的json模块
-            return json.dumps(self._to_dict(matrix))
+            # json只在走到此分支时才导入，不拖慢模块冷启动；
+            # 首次之后都是sys.modules缓存命中
+            import json
+
+            # 就地构建字典并序列化，省去_to_dict的显式循环与中间变量
+            return json.dumps({row[0]: row for row in matrix if row})
 
         elif self.output_format == 'csv':
             return self._to_csv(matrix)
@@ -541,50 +549,121 @@ class MatrixConverter(TextProcessor):
 
         使用第一列作为键，整行作为值
         """
-        if not matrix:
-            return {}
-
-        # 使用第一列作为键
-        result = {}
-        for row in matrix:
-            if row:
-                key = row[0]
-                result[key] = row
-        return result
+        # 字典推导式在C层构建，比逐项赋值的显式循环快；
+        # 空矩阵自然得到空字典
+        return {row[0]: row for row in matrix if row}
 
     def _to_csv(self, matrix: List[List[Any]]) -> str:
         """将矩阵转换为CSV格式字符串"""
-        rows = []
-        for row in matrix:
-            # 转义包含逗号的字段
-            escaped_row = []
-            for item in row:
-                if isinstance(item, str) and (',' in item or '\n' in item or '"' in item):
-                    escaped = '"' + item.replace('"', '""') + '"'
-                    escaped_row.append(escaped)
-                else:
-                    escaped_row.append(str(item))
-            rows.append(','.join(escaped_row))
-        return '\n'.join(rows)
+        if not matrix:
+            return ''
+
+        # csv.writer在C层完成转义与格式化，每行一次缓冲写入，
+        # 取代逐单元格的多次子串扫描和replace
+        buffer = StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerows(matrix)
+        # writerows在每行后都写lineterminator，去掉最后一个以保持
+        # 原有的无尾随换行格式
+        return buffer.getvalue()[:-1]
 
     def _to_text(self, matrix: List[List[Any]]) -> str:
         """将矩阵转换为文本格式"""
-        rows = []
-        for row in matrix:
-            rows.append(self.col_separator.join(map(str, row)))
-        return self.row_separator.join(rows)
+        # 行文本由生成器直接馈入join，不先物化中间列表
+        col_join = self.col_separator.join
+        return self.row_separator.join(col_join(map(str, row)) for row in matrix)
 
 
 class MatrixAggregator(TextProcessor):
-    """矩阵聚合处理器 (示例实现)"""
+    """矩阵聚合处理器"""
+
+    __slots__ = ('operation', 'axis')
+
+    def __init__(self, operation: str = 'sum', axis: Optional[str] = None):
+        """
+        :param operation: 聚合类型 ('sum', 'mean', 'min', 'max')
+        :param axis: 聚合方向 ('row', 'column')，None表示对全部元素聚合
+        """
+        # 验证聚合类型
+        valid_operations = ['sum', 'mean', 'min', 'max']
+        if operation not in valid_operations:
+            raise ParameterError(
+                processor_name="MatrixAggregator",
+                parameter="operation",
+                value=operation,
+                expected=f"one of {valid_operations}"
+            )
+        if axis not in (None, 'row', 'column'):
+            raise ParameterError(
+                processor_name="MatrixAggregator",
+                parameter="axis",
+                value=axis,
+                expected="'row', 'column' or None"
+            )
+        self.operation = operation
+        self.axis = axis
+
+    def process(self, matrix: List[List[Any]]) -> Any:
+        """对矩阵执行聚合计算"""
+        MatrixValidator.validate_matrix(matrix)
+
+        if not matrix:
+            return [] if self.axis else None
+
+        if self.axis == 'row':
+            return [self._aggregate(row) for row in matrix]
+        elif self.axis == 'column':
+            # zip在C层按列分组，无需手动转置
+            return [self._aggregate(col) for col in zip(*matrix)]
+
+        # 整体聚合：展平后一次计算
+        return self._aggregate([value for row in matrix for value in row])
+
+    def _aggregate(self, values) -> Any:
+        """聚合单个序列；sum/min/max均为C实现的内建函数"""
+        if self.operation == 'sum':
+            return sum(values)
+        elif self.operation == 'mean':
+            return sum(values) / len(values)
+        elif self.operation == 'min':
+            return min(values)
+        return max(values)
+
+
+class MatrixBatchProcessor(TextProcessor):
+    """
+    矩阵批量操作处理器
+
+    把一组矩阵处理器组装成单个处理器，中间结果在各步骤间直接传递。
+    处理器列表构造一次即可对任意多个矩阵复用，适合在循环里反复执行
+    同一串操作的场景。各步骤处理器照常各自校验输入。
+    """
+
+    __slots__ = ('processors',)
+
+    def __init__(self, processors: Optional[List[TextProcessor]] = None):
+        """
+        :param processors: 按执行顺序排列的矩阵处理器列表
+        """
+        self.processors = list(processors) if processors else []
+
+    def add(self, processor: TextProcessor):
+        """追加处理器，返回self便于链式调用"""
+        self.processors.append(processor)
+        return self
 
     def process(self, matrix: List[List[Any]]) -> Any:
-        raise NotImplementedError("MatrixAggregator 需要具体实现")
+        """按序执行全部操作（校验由各步骤处理器完成，入口不重复做）"""
+        for processor in self.processors:
+            matrix = processor.process(matrix)
+        return matrix
 
 
 class MatrixReshaper(TextProcessor):
     """矩阵重塑处理器 (示例实现)"""
 
+    __slots__ = ()
+
     def process(self, matrix: List[List[Any]]) -> Any:
         raise NotImplementedError("MatrixReshaper 需要具体实现")
 
@@ -592,5 +671,7 @@ class MatrixReshaper(TextProcessor):
 class CSVToMatrixProcessor(TextProcessor):
     """CSV到矩阵转换器 (示例实现)"""
 
+    __slots__ = ()
+
     def process(self, input_data: str) -> List[List[Any]]:
         raise NotImplementedError("CSVToMatrixProcessor 需要具体实现")